@@ -39,8 +39,21 @@ setup(
         "test": [
             "pytest",
             "pytest-cov"
+        ],
+        "hdf5": [
+            "h5py"  # reading MAT v7.3 output files
+        ],
+        "json": [
+            "orjson"  # fast path for JSON configs
         ]
     },
+
+    # CLI tools
+    entry_points={
+        "console_scripts": [
+            "shoreline-s-config-convert = shoreline_s_wrapper.config_loader:convert_config_cli",
+        ],
+    },
     
     # Metadata
     author="Henrique Faria Cordeiro",
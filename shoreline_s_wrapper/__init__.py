@@ -1,14 +1,19 @@
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
 from time import time
 from pathlib import Path
-from typing import Union, Dict, Any
+from typing import List, Union, Dict, Any
 import shoreline_s_wrapper.config_loader as cl
 import shoreline_s_wrapper.matlab_utils as mu
 from shoreline_s_wrapper.extract import (
     load_shoreline_matfile,
     extract_time_vector,
     extract_coastline_data,
+    extract_coastline_df,
     make_time_indexed_coastline_df,
+    load_coastline_df,
 )
 
 # TODO: Create output directory if doesn't exist
@@ -54,13 +59,15 @@ def run_with_engine(config, eng):
 def run_shoreline_simulation(config_input: Union[str, Path, Dict[str, Any]], eng=None):
     """
     Complete workflow from config to model execution
+    Note: dict inputs are normalized in place (date fields cast to
+    strings); pass a copy if the original must stay untouched.
     """
     if isinstance(config_input, (str, Path)):
-        logger.info(f"Loading yaml config file: {config_input}")
-        config = cl.load_yaml_config(str(config_input))
+        logger.info(f"Loading config file: {config_input}")
+        config = cl.load_config(str(config_input))
     elif isinstance(config_input, dict):
         logger.info("Loading provided config dictionary")
-        config = config_input.copy()
+        config = config_input
     else:
         raise TypeError(f"config_input must be str, Path, or dict, got {type(config_input)}")
     
@@ -80,11 +87,59 @@ def run_shoreline_simulation(config_input: Union[str, Path, Dict[str, Any]], eng
     return state, output
 
 
+def run_shoreline_batch(
+    configs: List[Union[str, Path, Dict[str, Any]]],
+    n_workers: int = None,
+):
+    """
+    Run independent simulations in parallel over a pool of warm MATLAB engines.
+
+    Each worker owns a separate MATLAB process; engine calls release the GIL
+    so a ThreadPoolExecutor is enough to keep all engines busy.
+    Args:
+        configs: List of yaml paths or config dictionaries
+        n_workers: Number of MATLAB engines to spawn (default: half the cores)
+    Returns:
+        List of (state, output) tuples, in the order of `configs`
+    """
+    if n_workers is None:
+        n_workers = max(1, (os.cpu_count() or 2) // 2)
+    n_workers = min(n_workers, len(configs)) or 1
+
+    logger.info(f"Pre-warming {n_workers} MATLAB engines for {len(configs)} configs")
+    engines = Queue()
+    for _ in range(n_workers):
+        engines.put(mu.acquire_engine())
+
+    def run_one(config_input):
+        eng = engines.get()
+        try:
+            result = run_shoreline_simulation(config_input, eng=eng)
+            # Reset workspace state so runs don't leak into each other
+            eng.clear('variables', nargout=0)
+            return result
+        finally:
+            engines.put(eng)
+
+    try:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(run_one, configs))
+    finally:
+        # Keep engines warm for follow-up batches
+        while not engines.empty():
+            mu.release_engine(engines.get())
+
+    return results
+
+
 # Export main function for easy import
 __all__ = [
     "run_shoreline_simulation",
+    "run_shoreline_batch",
     "load_shoreline_matfile",
     "extract_time_vector",
     "extract_coastline_data",
+    "extract_coastline_df",
     "make_time_indexed_coastline_df",
+    "load_coastline_df",
 ]
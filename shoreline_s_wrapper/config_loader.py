@@ -1,6 +1,21 @@
+import hashlib
+import json
 import logging
+import pickle
 import yaml
 from typing import Dict, Any
+
+try:
+    # libyaml C parser, 3-8x faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson as _orjson  # optional fast JSON path
+except ImportError:
+    _orjson = None
+
 from pathlib import Path
 from datetime import datetime, date
 from shoreline_s_wrapper.dimensions import (
@@ -11,28 +26,53 @@ from shoreline_s_wrapper.dimensions import (
 
 # TODO enforce isoformat for dates
 
+# Parsed-config cache keyed on file content hash: repeated loads of the
+# same fixture skip the (pure-Python) YAML parse and unpickle instead.
+_CONFIG_CACHE_DIR = Path.home() / ".cache" / "shoreline_s_wrapper"
+
+
+def _read_cached_config(cache_path: Path) -> Dict[str, Any]:
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError) as e:
+        logging.warning(f"Ignoring unreadable config cache {cache_path}: {e}")
+        return None
+
+
+def _write_cached_config(cache_path: Path, config: Dict[str, Any]):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logging.warning(f"Could not write config cache {cache_path}: {e}")
+
 
 def is_all_required_fields_present(
-    config: Dict[str, any], required_fields: list = REQUIRED_FIELDS
+    config: Dict[str, any], required_fields: frozenset = REQUIRED_FIELDS
 ) -> bool:
 
-    missing_fields = [f for f in required_fields if f not in config]
+    # dict.keys() is a set-like view, so the difference runs entirely in C
+    missing_fields = frozenset(required_fields) - config.keys()
     if missing_fields:
-        logging.warning((f"Missing required fields: {', '.join(missing_fields)}"))
+        logging.warning((f"Missing required fields: {', '.join(sorted(missing_fields))}"))
         return False
     return True
 
 
 def cast_config_datetime_obj_to_date_str(config: dict) -> dict:
     # TODO Allow datetimes
-    return {
-        key: (
-            val.strftime(DEFAULT_DATE_FORMAT)
-            if (isinstance(val, datetime) | isinstance(val, date))
-            else val
-        )
-        for key, val in config.items()
-    }
+    # Mutates in place (and returns the same dict) to avoid building a
+    # second O(K) copy of the config per run. isoformat() emits the same
+    # YYYY-MM-DD as strftime(DEFAULT_DATE_FORMAT) without re-parsing the
+    # format string on every call
+    for key, val in config.items():
+        if isinstance(val, datetime):
+            config[key] = val.date().isoformat()
+        elif isinstance(val, date):
+            config[key] = val.isoformat()
+    return config
 
 
 def load_yaml_config(
@@ -45,11 +85,70 @@ def load_yaml_config(
     Returns:
         Dictionary with configuration parameters
     """
-    with open(Path(config_path), "r") as f:
-        config = yaml.safe_load(f)
+    data = Path(config_path).read_bytes()
+
+    # Content hash keys the cache, so edits to the file (mtime/content
+    # changes) land on a fresh key and stale entries are never served.
+    cache_path = _CONFIG_CACHE_DIR / f"{hashlib.blake2b(data).hexdigest()}.pkl"
+    if cache_path.exists():
+        cached = _read_cached_config(cache_path)
+        if cached is not None:
+            return cached
+
+    config = yaml.load(data, Loader=_YamlLoader)
 
     # Remove metadata fields if present
     config.pop("config_version", None)
     config.pop("description", None)
 
+    _write_cached_config(cache_path, config)
     return config
+
+
+def load_config(
+    config_path: str,
+) -> Dict[str, Any]:
+    """
+    Format-dispatching configuration loader
+    JSON (orjson when installed) is the recommended format for configs that
+    are authored once and run many times; convert existing YAML with the
+    shoreline-s-config-convert CLI. Anything else goes through
+    load_yaml_config.
+    Args:
+        config_path: Path to a .json or YAML config file
+    Returns:
+        Dictionary with configuration parameters
+    """
+    path = Path(config_path)
+    if path.suffix.lower() != ".json":
+        return load_yaml_config(config_path)
+
+    data = path.read_bytes()
+    config = _orjson.loads(data) if _orjson else json.loads(data)
+
+    # Remove metadata fields if present
+    config.pop("config_version", None)
+    config.pop("description", None)
+
+    return config
+
+
+def convert_config_cli(argv=None):
+    """CLI entry point: shoreline-s-config-convert in.yaml out.json"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Convert a YAML config to the faster JSON format"
+    )
+    parser.add_argument("input", help="YAML config file to convert")
+    parser.add_argument("output", help="JSON file to write")
+    args = parser.parse_args(argv)
+
+    config = yaml.load(Path(args.input).read_bytes(), Loader=_YamlLoader)
+    if _orjson:
+        payload = _orjson.dumps(config, option=_orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        # stdlib fallback; dates serialize as their isoformat strings
+        payload = json.dumps(config, default=str, indent=2).encode("utf-8")
+    Path(args.output).write_bytes(payload)
+    logging.info(f"Wrote {args.output}")
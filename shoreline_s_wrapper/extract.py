@@ -1,6 +1,9 @@
+import hashlib
+import logging
 import scipy.io as sio
 import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from typing import Dict, Any, Union, Optional
 from pathlib import Path
 
@@ -8,8 +11,17 @@ START_DATE_FIELD = "reftime"
 END_DATE_FIELD = "endofsimulation"
 TIMESTEP_FIELD = "dt"
 
+# Extracted-DataFrame cache; same location as the config cache
+_DF_CACHE_DIR = Path.home() / ".cache" / "shoreline_s_wrapper"
+
 
 class TimeAxis:
+    # Computed time vectors keyed by (start date, dt, iteration bytes).
+    # Sweeps and plot-refresh loops rebuild the same axis hundreds of
+    # times; the bounded LRU makes repeats O(1)
+    _CACHE: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+    _CACHE_MAX = 128
+
     def __init__(
         self,
         timestep_in_years: int,
@@ -33,14 +45,28 @@ class TimeAxis:
         if self.synthetic:
             raise ValueError("Synthetic time vector creation not implemented.")
 
-        # Calendar-based run
+        # Calendar-based run: broadcast instead of per-element Timestamp
+        # arithmetic, so all the work stays in compiled NumPy ufuncs
         if self.start_date is not None:
-            return np.array(
-                [
-                    self.start_date + self.timestep_in_days * it
-                    for it in self.iteration_array
-                ]
+            iterations = np.asarray(self.iteration_array)
+            key = (
+                str(self.start_date),
+                self.timestep_in_days.value,
+                iterations.tobytes(),
             )
+            cached = TimeAxis._CACHE.get(key)
+            if cached is not None:
+                TimeAxis._CACHE.move_to_end(key)
+                return cached
+
+            time_vector = (
+                self.start_date.to_datetime64()
+                + iterations * self.timestep_in_days.to_timedelta64()
+            )
+            TimeAxis._CACHE[key] = time_vector
+            if len(TimeAxis._CACHE) > TimeAxis._CACHE_MAX:
+                TimeAxis._CACHE.popitem(last=False)
+            return time_vector
 
     def __len__(self):
         """Return number of time steps in time vector."""
@@ -53,21 +79,142 @@ class TimeAxis:
         return f"<TimeAxis mode={mode}, dt_in_days={freq}, len={len(self.time_vector)}>"
 
 
-def load_shoreline_matfile(matfile_path: Path) -> Dict[str, Any]:
+class MatlabH5Struct:
+    """
+    Lazy dict-like view over a struct group in a MAT v7.3 (HDF5) file.
+    Fields are read from disk only when accessed, so large outputs never
+    materialize variables the caller doesn't touch.
+    """
+
+    def __init__(self, group):
+        self._group = group
+
+    def __getitem__(self, field_name: str):
+        # HDF5 stores MATLAB arrays transposed; flip back to match loadmat
+        return np.asarray(self._group[field_name]).T
+
+    def __contains__(self, field_name: str) -> bool:
+        return field_name in self._group
+
+    def keys(self):
+        return self._group.keys()
+
+
+class LazyMatStruct:
+    """
+    Lazy stand-in for one struct variable in a MAT v5 file. The variable
+    is decoded on first field access and cached, so touching S never pays
+    for a multi-GB O (and vice versa).
+    """
+
+    def __init__(self, matfile_path: Path, var_name: str):
+        self._path = matfile_path
+        self._var_name = var_name
+        self._data = None
+
+    def _load(self):
+        if self._data is None:
+            loaded = sio.loadmat(
+                str(self._path),
+                variable_names=[self._var_name],
+                squeeze_me=True,
+                simplify_cells=True,
+                mat_dtype=False,
+            )
+            self._data = loaded.get(self._var_name, {})
+        return self._data
+
+    def __getitem__(self, field_name: str):
+        return self._load()[field_name]
+
+    def __contains__(self, field_name: str) -> bool:
+        return field_name in self._load()
+
+    def keys(self):
+        return self._load().keys()
+
+
+def _read_matfile_header(matfile_path: Path) -> str:
+    with open(matfile_path, "rb") as f:
+        return f.read(116).rstrip(b"\x00 ").decode("utf-8", errors="replace")
+
+
+def _is_hdf5_matfile(matfile_path: Path) -> bool:
+    """MAT v7.3 files are HDF5, with the signature at 0 or after the 512-byte userblock"""
+    magic = b"\x89HDF"
+    with open(matfile_path, "rb") as f:
+        if f.read(4) == magic:
+            return True
+        f.seek(512)
+        return f.read(4) == magic
+
+
+def _load_matfile_hdf5(matfile_path: Path) -> Dict[str, Any]:
+    try:
+        import h5py
+    except ImportError as e:
+        raise ImportError(
+            f"{matfile_path} is a MAT v7.3 (HDF5) file; install h5py to read it"
+        ) from e
+
+    h5_file = h5py.File(str(matfile_path), "r")
+    header = _read_matfile_header(matfile_path)
+
+    def lazy_struct(var_name):
+        if var_name in h5_file:
+            return MatlabH5Struct(h5_file[var_name])
+        return np.array([])
+
+    return {
+        "model_state": lazy_struct("S"),
+        "output": lazy_struct("O"),
+        "metadata": {
+            "header": header,
+            "version": "7.3",
+            "globals": [],
+        },
+    }
+
+
+def load_shoreline_matfile(matfile_path: Path, lazy: bool = False) -> Dict[str, Any]:
     """
-    Load ShorelineS MAT file and extract useful data structures
+    Load ShorelineS MAT file and extract useful data structures.
+    MAT v7.3 (HDF5) files are opened lazily via h5py; older versions go
+    through scipy.io.loadmat. With lazy=True, v5 variables are also
+    deferred: S and O decode on first field access, keeping the working
+    set bounded by what the caller actually touches.
     """
     if not matfile_path.exists():
         raise FileNotFoundError(f"MAT file not found: {matfile_path}")
 
-    # Load the MAT file
-    mat_data = sio.loadmat(str(matfile_path))
+    if _is_hdf5_matfile(matfile_path):
+        return _load_matfile_hdf5(matfile_path)
+
+    if lazy:
+        return {
+            "model_state": LazyMatStruct(matfile_path, "S"),
+            "output": LazyMatStruct(matfile_path, "O"),
+            "metadata": {
+                "header": _read_matfile_header(matfile_path),
+                "version": "",
+                "globals": [],
+            },
+        }
+
+    # Load only the variables we use; simplify_cells unwraps struct arrays
+    # into plain dicts so no per-field squeeze/indexing is needed downstream
+    mat_data = sio.loadmat(
+        str(matfile_path),
+        variable_names=["S", "O"],
+        squeeze_me=True,
+        simplify_cells=True,
+        mat_dtype=False,
+    )
 
     # Extract main components
     results = {
         "model_state": mat_data.get("S", np.array([])),  # Input and state settings
         "output": mat_data.get("O", np.array([])),  # Output results
-        # 'P': mat_data.get('P', np.array([])),  # ignore
         "metadata": {
             "header": mat_data.get("__header__", b"").decode("utf-8"),
             "version": mat_data.get("__version__", ""),
@@ -80,8 +227,13 @@ def load_shoreline_matfile(matfile_path: Path) -> Dict[str, Any]:
 
 def extract_from_matlab_array(data, field_name: str, default=np.array([])):
     # TODO  make key-safe
-    field_data = np.array(data[field_name]).squeeze()
-    return field_data if len(field_data) > 0 else default
+    # asarray is a no-copy view when the field is already an ndarray;
+    # squeeze only when there is a unit dimension to drop, and use .size
+    # for the empty check since len() fails on 0-d arrays
+    field_data = np.asarray(data[field_name])
+    if 1 in field_data.shape:
+        field_data = field_data.squeeze()
+    return field_data if field_data.size > 0 else default
 
 
 def extract_time_vector(modeled_data: Dict[str, Any], config: dict) -> TimeAxis:
@@ -129,9 +281,97 @@ def extract_coastline_data(modeled_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def extract_coastline_df(
+    modeled_data: Dict[str, Any],
+    time_vector: Union[np.ndarray, pd.DatetimeIndex],
+    dtype: Optional[np.dtype] = None,
+) -> pd.DataFrame:
+    """
+    Extract coastline coordinates and build the time-indexed DataFrame in
+    one pass, without the intermediate dict or flatten() copies of
+    extract_coastline_data + make_time_indexed_coastline_df.
+    """
+    x = np.asarray(extract_from_matlab_array(modeled_data, "x"))
+    y = np.asarray(extract_from_matlab_array(modeled_data, "y"))
+    if dtype is not None:
+        x = x.astype(dtype, copy=False)
+        y = y.astype(dtype, copy=False)
+
+    group_size, timesteps = x.shape
+    if len(time_vector) != timesteps:
+        raise ValueError(
+            f"Time vector length ({len(time_vector)}) must match number of timesteps ({timesteps})."
+        )
+
+    time_values = (
+        time_vector.values
+        if hasattr(time_vector, "values")
+        else np.asarray(time_vector, dtype="datetime64[ns]")
+    )
+    # broadcast_to tiles without allocating; the reshape materializes the
+    # repeated index once, directly at its final size
+    time_index = np.broadcast_to(
+        time_values[:, None], (timesteps, group_size)
+    ).reshape(-1)
+
+    # reshape(-1, order='F') is a view when the source keeps the MATLAB
+    # F-contiguous layout; copy=False hands the arrays to the DataFrame
+    # without another pass over the bytes
+    df = pd.DataFrame(
+        {"x": x.reshape(-1, order="F"), "y": y.reshape(-1, order="F")},
+        index=pd.DatetimeIndex(time_index),
+        copy=False,
+    )
+    df.index.name = "time"
+    return df
+
+
+def load_coastline_df(
+    matfile_path: Path,
+    config: dict,
+    cache_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """
+    Load a ShorelineS MAT file and build the time-indexed coastline
+    DataFrame, caching the result as Parquet keyed on the file's mtime
+    and size. Repeat loads (e.g. iterating on plot tweaks) skip MAT
+    decoding entirely and read the Arrow file instead.
+    """
+    matfile_path = Path(matfile_path)
+    if not matfile_path.exists():
+        raise FileNotFoundError(f"MAT file not found: {matfile_path}")
+    cache_dir = Path(cache_dir) if cache_dir else _DF_CACHE_DIR
+
+    stat = matfile_path.stat()
+    key = hashlib.blake2b(
+        f"{matfile_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+    ).hexdigest()
+    cache_path = cache_dir / f"{key}.parquet"
+
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable coastline cache {cache_path}: {e}")
+
+    modeled_data = load_shoreline_matfile(matfile_path, lazy=True)
+    time_axis = extract_time_vector(modeled_data["output"], config)
+    df = extract_coastline_df(modeled_data["output"], time_axis.time_vector)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path, compression="zstd")
+    except (ImportError, ValueError, OSError) as e:
+        # No parquet engine installed (or unwritable cache dir): still
+        # return the freshly built frame
+        logging.warning(f"Could not write coastline cache {cache_path}: {e}")
+    return df
+
+
 def make_time_indexed_coastline_df(
     coastline_coords_dict: dict,
     time_vector: Union[np.ndarray, pd.DatetimeIndex],
+    dtype: Optional[np.dtype] = None,
 ) -> pd.DataFrame:
     """
     Create a time-indexed coastline DataFrame from modeled coordinates and a time array.
@@ -142,6 +382,10 @@ def make_time_indexed_coastline_df(
         Dictionary with keys "x" and "y", each shaped (n_points, n_timesteps).
     time_vector : np.ndarray or pd.DatetimeIndex
         Time vector of length equal to the number of timesteps.
+    dtype : np.dtype, optional
+        Coordinate dtype for the output columns; pass np.float32 to halve
+        memory for large coastlines (meter-scale coordinates stay exact
+        in fp32). Defaults to the source dtype.
 
     Returns
     -------
@@ -150,6 +394,9 @@ def make_time_indexed_coastline_df(
     """
     x = np.asarray(coastline_coords_dict["x"])
     y = np.asarray(coastline_coords_dict["y"])
+    if dtype is not None:
+        x = x.astype(dtype, copy=False)
+        y = y.astype(dtype, copy=False)
 
     group_size, timesteps = x.shape
     if len(time_vector) != timesteps:
@@ -157,9 +404,20 @@ def make_time_indexed_coastline_df(
             f"Time vector length ({len(time_vector)}) must match number of timesteps ({timesteps})."
         )
 
-    time_index = np.repeat(time_vector, group_size)
+    # Repeat on a datetime64[ns] ndarray so the tiling happens in C, not on
+    # a Python list of date objects
+    time_values = (
+        time_vector.values
+        if hasattr(time_vector, "values")
+        else np.asarray(time_vector, dtype="datetime64[ns]")
+    )
+    time_index = np.repeat(time_values, group_size)
+
+    # Column-major ravel matches the MATLAB layout: all points of timestep 0,
+    # then timestep 1, ... — aligned with the repeated time index above
     df = pd.DataFrame(
-        {"x": x.flatten(), "y": y.flatten()}, index=pd.DatetimeIndex(time_index)
+        {"x": x.ravel(order="F"), "y": y.ravel(order="F")},
+        index=pd.DatetimeIndex(time_index),
     )
     df.index.name = "time"
     return df
@@ -1,11 +1,19 @@
-import matlab.engine
 import os
+import queue
 import signal
 import logging
+from itertools import chain
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from shoreline_s_wrapper.dimensions import MODELLING_PROJECT_ROOT
 
+if TYPE_CHECKING:
+    import matlab.engine
+
+# matlab.engine is imported lazily inside the functions that need it: the
+# shim probes the MATLAB install on import, which penalizes (or breaks)
+# analysis boxes that only use the extract helpers
+
 # TODO-1: Add error handling for MATLAB engine startup
 #         (matlab.engine.EngineError)
 # TODO-5: Add MATLAB version compatibility check
@@ -14,11 +22,60 @@ from shoreline_s_wrapper.dimensions import MODELLING_PROJECT_ROOT
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Pool of idle engines kept warm between simulations. Starting MATLAB is a
+# multi-second cold start, so sessions return their engine here instead of
+# quitting it; the next MATLABSession reuses it.
+_ENGINE_POOL: "queue.Queue[matlab.engine.MatlabEngine]" = queue.Queue()
+
+
+def acquire_engine() -> "matlab.engine.MatlabEngine":
+    """Get an idle engine from the pool, starting a fresh one on miss"""
+    import matlab.engine
+
+    try:
+        eng = _ENGINE_POOL.get(block=False)
+        logger.info("Reusing warm MATLAB engine from pool")
+        return eng
+    except queue.Empty:
+        logger.info("Starting MATLAB engine...")
+        eng = matlab.engine.start_matlab()
+        logger.info("MATLAB engine started successfully")
+        return eng
+
+
+def release_engine(eng: "matlab.engine.MatlabEngine"):
+    """Return an engine to the pool, clearing workspace state first"""
+    try:
+        eng.clear('all', nargout=0)
+    except Exception as e:
+        # Engine is unusable; drop it instead of poisoning the pool
+        logger.warning(f"Could not reset MATLAB engine, discarding it: {e}")
+        try:
+            eng.quit()
+        except Exception:
+            pass
+        return
+    _ENGINE_POOL.put(eng)
+
+
+def shutdown_engine_pool():
+    """Quit all pooled engines (e.g. at the end of a batch run)"""
+    while True:
+        try:
+            eng = _ENGINE_POOL.get(block=False)
+        except queue.Empty:
+            return
+        try:
+            eng.quit()
+        except Exception as e:
+            logger.warning(f"Error during MATLAB shutdown: {e}")
+
+
 class MATLABSession:
     """Managed MATLAB session with graceful shutdown handling"""
     
     def __init__(self):
-        self.eng: Optional[matlab.engine.MatlabEngine] = None
+        self.eng: Optional["matlab.engine.MatlabEngine"] = None
         self._original_sigint_handler = None
         self._original_sigterm_handler = None
         
@@ -31,24 +88,21 @@ class MATLABSession:
         """Context manager exit - always cleanup"""
         self.quit()
         
-    def start(self) -> matlab.engine.MatlabEngine:
-        """Start MATLAB engine with signal handlers"""
-        logger.info("Starting MATLAB engine...")
-        self.eng = matlab.engine.start_matlab()
-        
+    def start(self) -> "matlab.engine.MatlabEngine":
+        """Acquire a MATLAB engine (pooled or fresh) with signal handlers"""
+        self.eng = acquire_engine()
+
         # Set up signal handlers for graceful shutdown
         self._setup_signal_handlers()
-        
-        logger.info("MATLAB engine started successfully")
+
         return self.eng
-        
+
     def quit(self):
-        """Gracefully shutdown MATLAB engine"""
+        """Release the MATLAB engine back to the warm pool"""
         if self.eng is not None:
             try:
-                logger.info("Shutting down MATLAB engine...")
-                self.eng.quit()
-                logger.info("MATLAB engine shutdown complete")
+                logger.info("Releasing MATLAB engine back to pool...")
+                release_engine(self.eng)
             except Exception as e:
                 logger.warning(f"Error during MATLAB shutdown: {e}")
             finally:
@@ -80,8 +134,15 @@ class MATLABSession:
         return self.eng is not None
 
 
+# genpath walks the whole functions tree inside MATLAB on every call;
+# cache its output per path and remember which engines already have a
+# path added so warm-pool reuse skips the walk entirely
+_GENPATH_CACHE: Dict[str, str] = {}
+_ADDED_PATHS = set()
+
+
 def initialize_matlab_paths(
-        eng, 
+        eng,
         root_path = None
         ):
     """Set up MATLAB paths from Python"""
@@ -92,16 +153,23 @@ def initialize_matlab_paths(
         # NOTE: sensitive to changes in dir structure
         # Get the absolute path to this file's directory
         current_file = Path(__file__).resolve()
-        root_path = current_file.parent.parent 
+        root_path = current_file.parent.parent
         logging.info(f"root path: {root_path}")
 
     paths_to_add = [
         root_path / matlab_functions_dir,
     ]
-    
+
     for path in paths_to_add:
-        ml_paths = eng.genpath(str(path))
+        path_str = str(path)
+        if (id(eng), path_str) in _ADDED_PATHS:
+            continue
+        ml_paths = _GENPATH_CACHE.get(path_str)
+        if ml_paths is None:
+            ml_paths = eng.genpath(path_str)
+            _GENPATH_CACHE[path_str] = ml_paths
         eng.addpath(ml_paths, nargout=0)
+        _ADDED_PATHS.add((id(eng), path_str))
 
 def looks_like_matlab_cell(s: str) -> bool:
     s = s.strip()
@@ -111,7 +179,45 @@ def is_known_str_type_list(k: str) -> bool:
         str_type_list_keys = {"LDBplot"}  # TODO move to dimensions
         return k in str_type_list_keys
 
-def config_to_matlab_struct(eng: matlab.engine.MatlabEngine, 
+# Sentinel for values that need MATLAB-side construction (cell arrays)
+_NEEDS_ENGINE = object()
+
+
+def _handle_none(key, value):
+    return float('nan')  # TODO validate this behavior
+
+
+def _handle_str(key, value):
+    if looks_like_matlab_cell(value):
+        return _NEEDS_ENGINE
+    return value
+
+
+def _handle_list(key, value):
+    import matlab
+
+    if len(value) == 0:
+        return matlab.double([])
+    if is_known_str_type_list(key):
+        return _NEEDS_ENGINE
+    clean_list = [v if v is not None else float('nan') for v in value]  # mixing types ......
+    return matlab.double(clean_list)
+
+
+def _handle_passthrough(key, value):
+    return value
+
+
+# Per-type converters, looked up once per value instead of walking an
+# isinstance chain
+_HANDLERS = {
+    type(None): _handle_none,
+    str: _handle_str,
+    list: _handle_list,
+}
+
+
+def config_to_matlab_struct(eng: "matlab.engine.MatlabEngine",
                           config: Dict[str, Any]) -> Any:
     """
     Converts Python dictionary to MATLAB struct
@@ -121,33 +227,33 @@ def config_to_matlab_struct(eng: matlab.engine.MatlabEngine,
     Returns:
         MATLAB struct ready for ShorelineS
     """
-    ml_struct = eng.struct()
+    # Convert everything locally first: each ml_struct[key] = ... is a
+    # synchronous round-trip to the MATLAB process, so the bulk of the
+    # fields goes over in a single eng.struct(...) varargs call
+    direct_fields = {}
+    engine_fields = {}
 
     for key, value in config.items():
-        # logging.info(f"Processing: {key}, {value}")
         # Skip any remaining metadata fields
         if key.startswith('_'):
             continue
-            
-        # Handle null/None values
-        if value is None:
-            ml_struct[key] = eng.nan  # TODO validate this behavior
-        # Convert lists to MATLAB arrays
-
-        if isinstance(value, str) and looks_like_matlab_cell(value):
-             ml_struct[key] = eng.eval(value)   ## FIXME dangerous
-
-        elif isinstance(value, list):
-            if len(value) == 0:
-                ml_struct[key] = matlab.double([])
-            elif is_known_str_type_list(key):
-                ml_struct[key] = eng.cellstr(value)
-            else:
-                clean_list = [v if v is not None else eng.nan for v in value]  # mixing types ......
-                ml_struct[key] = matlab.double(clean_list)
-            
-        # Pass through other values
+
+        handler = _HANDLERS.get(type(value), _handle_passthrough)
+        converted = handler(key, value)
+        if converted is _NEEDS_ENGINE:
+            engine_fields[key] = value
         else:
-            ml_struct[key] = value
-    
+            direct_fields[key] = converted
+
+    # One RPC for all directly-marshallable fields
+    ml_struct = eng.struct(*chain.from_iterable(direct_fields.items()))
+
+    # Cell arrays can't go through struct() varargs (MATLAB would expand
+    # them into a struct array), so they are assigned one by one
+    for key, value in engine_fields.items():
+        if isinstance(value, list):
+            ml_struct[key] = eng.cellstr(value)
+        else:
+            ml_struct[key] = eng.eval(value)   ## FIXME dangerous
+
     return ml_struct
\ No newline at end of file